@@ -5,8 +5,6 @@ import eip712_structs
 # allow camelCase
 # ruff: noqa: N803
 # pylint: disable=invalid-name
-# allow missing class docstring
-# pylint: disable=missing-class-docstring
 
 def make_domain(name=None, version=None, chainId=None, verifyingContract=None, salt=None):
     """Create the standard EIP712Domain struct.
@@ -16,24 +14,26 @@ def make_domain(name=None, version=None, chainId=None, verifyingContract=None, s
     if all(i is None for i in [name, version, chainId, verifyingContract, salt]):
         raise ValueError("At least one argument must be given.")
 
-    class EIP712Domain(eip712_structs.EIP712Struct):
-        pass
-
+    members = {}
     kwargs = {}
     if name is not None:
-        EIP712Domain.name = eip712_structs.String()  # type: ignore
+        members["name"] = eip712_structs.String()
         kwargs["name"] = str(name)
     if version is not None:
-        EIP712Domain.version = eip712_structs.String()  # type: ignore
+        members["version"] = eip712_structs.String()
         kwargs["version"] = str(version)
     if chainId is not None:
-        EIP712Domain.chainId = eip712_structs.Uint(256)  # type: ignore
+        members["chainId"] = eip712_structs.Uint(256)
         kwargs["chainId"] = int(chainId)
     if verifyingContract is not None:
-        EIP712Domain.verifyingContract = eip712_structs.Address()  # type: ignore
+        members["verifyingContract"] = eip712_structs.Address()
         kwargs["verifyingContract"] = verifyingContract
     if salt is not None:
-        EIP712Domain.salt = eip712_structs.Bytes(32)  # type: ignore
+        members["salt"] = eip712_structs.Bytes(32)
         kwargs["salt"] = salt
 
-    return EIP712Domain(**kwargs)
+    # Built in one go, rather than adding each member to an empty class. The members are known in order already, so
+    # they are seeded rather than found by scanning the new class.
+    domain_struct = type("EIP712Domain", (eip712_structs.EIP712Struct,), {"__module__": __name__, **members})
+    domain_struct._cache["members"] = tuple(members.items())  # pylint: disable=protected-access
+    return domain_struct(**kwargs)
@@ -1,19 +1,50 @@
 """EIP-712 Structs."""
 
-import functools
 import json
-import operator
 import re
-from collections import defaultdict
-from typing import List, NamedTuple, Tuple
+from abc import ABCMeta
+from typing import Callable, Iterable, List, NamedTuple, Tuple
 
-from eth_utils.crypto import keccak
+from eth_hash.auto import keccak
 
 import eip712_structs
 from eip712_structs.types import Array, BytesJSONEncoder, EIP712Type, from_solidity_type
 
+# Value types which can't be modified in place
+_IMMUTABLE_VALUE_TYPES = frozenset({bool, bytes, int, str, type(None)})
 
-class EIP712Struct(EIP712Type):
+# Matches a struct type name, optionally followed by an array spec, like "Person" or "Person[3]"
+struct_type_pattern = re.compile(r"([a-zA-Z0-9_]+)(\[(\d+)?\])?")
+
+# Bumped whenever a struct class with cached data is modified. Cached data which depends on other struct classes
+# (like the encoded type, which includes the referenced structs) is only valid for the generation it was computed in.
+_cache_generation = 0  # pylint: disable=invalid-name
+
+
+class _EIP712StructMeta(ABCMeta):
+    """Metaclass for EIP712Struct, which drops cached class data whenever a struct class is modified.
+
+    Members may be added to a struct class after it has been defined (e.g. by ``make_domain`` or ``from_message``),
+    so anything derived from the class members must be recomputed after such a change.
+    Based on ABCMeta, so that structs may still be combined with ``abc.ABC``. This makes creating a struct class a
+    few microseconds slower than with a plain metaclass, which is accepted in exchange for the cached class data.
+    """
+
+    def __setattr__(cls, name, value):
+        """Set a class attribute, then invalidate the cached class data."""
+        type.__setattr__(cls, name, value)
+        # Checked here, since most attributes are set on new classes which have nothing cached yet
+        if cls._cache:
+            cls._invalidate_caches()
+
+    def __delattr__(cls, name):
+        """Delete a class attribute, then invalidate the cached class data."""
+        type.__delattr__(cls, name)
+        if cls._cache:
+            cls._invalidate_caches()
+
+
+class EIP712Struct(EIP712Type, metaclass=_EIP712StructMeta):
     """Represent an EIP712 struct. Subclass it to use it.
 
     Examples:
@@ -25,9 +56,13 @@ class EIP712Struct(EIP712Type):
         struct_instance = MyStruct(some_param='some_value')
     """
 
+    # Data derived from the class members, computed lazily. Each subclass gets its own dict.
+    _cache: dict = {}
+
     def __init__(self, **kwargs):
         """Initialize the struct."""
         super().__init__(type_name=self.type_name, none_val=None)
+        self._hash_cache = None
         self.values = {}
         for name, typ in self.get_members():
             value = kwargs.get(name)
@@ -43,7 +78,21 @@ class EIP712Struct(EIP712Type):
     def __init_subclass__(cls, **kwargs):
         """Initialize the subclass."""
         super().__init_subclass__(**kwargs)
-        cls.type_name = cls.__name__
+        # A new class has nothing cached yet, so these skip the invalidation hook
+        type.__setattr__(cls, "_cache", {})
+        type.__setattr__(cls, "type_name", cls.__name__)
+
+    @classmethod
+    def _invalidate_caches(cls):
+        """Drop the cached class data after the class was modified.
+
+        Other struct classes may have cached data derived from this one (e.g. an encoded type which includes it as a
+        reference), so the cache generation is bumped too. Deriving anything from a struct class always caches its
+        members first, so a class with an empty cache can be modified without calling this.
+        """
+        global _cache_generation  # noqa: PLW0603  # pylint: disable=global-statement,invalid-name
+        cls._cache.clear()
+        _cache_generation += 1
 
     def _encode_value(self, value=None):
         """Return the struct's encoded value.
@@ -53,17 +102,45 @@ class EIP712Struct(EIP712Type):
         Args:
             value (Any): This parameter is not used for structs.
         """
-        encoded_values = []
-        for name, typ in self.get_members():
+        values = self.values
+        return b"".join([encoder(values) for _, encoder in self._get_field_encoders()])
+
+    @classmethod
+    def _get_field_encoders(cls) -> Tuple[Tuple[str, Callable[[dict], bytes]], ...]:
+        """Return a tuple of (<parameter_name>, <encoder>) tuples, one for each member of the struct.
+
+        Each encoder takes a struct's value dictionary and returns the bytes32 representation of that member's value.
+        """
+        encoders = cls._cache.get("field_encoders")
+        if encoders is None:
+            encoders = cls._cache["field_encoders"] = cls._build_encoders()
+        return encoders
+
+    @classmethod
+    def _build_encoders(cls) -> Tuple[Tuple[str, Callable[[dict], bytes]], ...]:
+        encoders = []
+        for name, typ in cls.get_members():
             if isinstance(typ, type) and issubclass(typ, EIP712Struct):
-                # Nested structs are recursively hashed, with the resulting 32-byte hash appended to the list of values
-                sub_struct = self.get_data_value(name)
-                assert sub_struct is not None, f"Value for {name} not set"
-                encoded_values.append(sub_struct.hash_struct())
+
+                def encode_struct(values, name=name):
+                    # Nested structs are recursively hashed, with the resulting 32-byte hash used as the value
+                    sub_struct = values.get(name)
+                    assert sub_struct is not None, f"Value for {name} not set"
+                    return sub_struct.hash_struct()
+
+                encoders.append((name, encode_struct))
+            elif type(typ).encode_value is EIP712Type.encode_value:
+                # Regular types are encoded as normal. Bind the type's encoder up front, and substitute missing values
+                # here rather than dispatching through encode_value for every value.
+                def encode_member(values, name=name, encode=typ._encode_value, none_val=typ.none_val):  # pylint: disable=protected-access
+                    value = values[name]
+                    return encode(none_val if value is None else value)
+
+                encoders.append((name, encode_member))
             else:
-                # Regular types are encoded as normal
-                encoded_values.append(typ.encode_value(self.values[name]))
-        return b"".join(encoded_values)
+                # The type overrides encode_value itself, so it must be used
+                encoders.append((name, lambda values, name=name, encode=typ.encode_value: encode(values[name])))
+        return tuple(encoders)
 
     def get_data_value(self, name):
         """Get the value of the given struct parameter."""
@@ -79,23 +156,49 @@ class EIP712Struct(EIP712Type):
 
         Nested structs instances are also converted to dict form.
         """
-        return {k: v.data_dict() if isinstance(v, EIP712Struct) else v for k, v in self.values.items()}
+        nested_members = self._get_nested_members()
+        if not nested_members:
+            return dict(self.values)
+        return {
+            k: v.data_dict() if k in nested_members and isinstance(v, EIP712Struct) else v
+            for k, v in self.values.items()
+        }
+
+    @classmethod
+    def _get_nested_members(cls) -> frozenset:
+        """Return the names of the members which are nested structs."""
+        nested_members = cls._cache.get("nested_members")
+        if nested_members is None:
+            nested_members = cls._cache["nested_members"] = frozenset(
+                name for name, typ in cls.get_members() if isinstance(typ, type) and issubclass(typ, EIP712Struct)
+            )
+        return nested_members
 
     @classmethod
     def _encode_type(cls, resolve_references: bool) -> str:
         member_sigs = [f"{typ.type_name} {name}" for name, typ in cls.get_members()]
-        struct_sig = f'{cls.type_name}({",".join(member_sigs)})'
+        struct_sigs = [f'{cls.type_name}({",".join(member_sigs)})']
 
         if resolve_references:
-            reference_structs = set()
-            cls._gather_reference_structs(reference_structs)
             sorted_structs = sorted(
-                [s for s in reference_structs if s != cls],
+                [s for s in cls._get_reference_structs() if s != cls],
                 key=lambda s: s.type_name,
             )
-            for struct in sorted_structs:
-                struct_sig += struct._encode_type(resolve_references=False)  # pylint: disable=protected-access
-        return struct_sig
+            struct_sigs.extend(
+                struct._encode_type(resolve_references=False)  # pylint: disable=protected-access
+                for struct in sorted_structs
+            )
+        return "".join(struct_sigs)
+
+    @classmethod
+    def _get_reference_structs(cls) -> frozenset:
+        """Return every struct type referenced by this struct type, directly or indirectly."""
+        entry = cls._cache.get("reference_structs")
+        if entry is None or entry[0] != _cache_generation:
+            struct_set = set()
+            cls._gather_reference_structs(struct_set)
+            entry = cls._cache["reference_structs"] = (_cache_generation, frozenset(struct_set))
+        return entry[1]
 
     @classmethod
     def _gather_reference_structs(cls, struct_set):
@@ -112,31 +215,63 @@ class EIP712Struct(EIP712Type):
 
         Nested structs are also encoded, and appended in alphabetical order.
         """
-        return cls._encode_type(resolve_references=True)
+        entry = cls._cache.get("encoded_type")
+        if entry is None or entry[0] != _cache_generation:
+            entry = cls._cache["encoded_type"] = (_cache_generation, cls._encode_type(resolve_references=True))
+        return entry[1]
 
     @classmethod
     def type_hash(cls) -> bytes:
         """Get the keccak hash of the struct's encoded type."""
-        return keccak(text=cls.encode_type())
+        entry = cls._cache.get("type_hash")
+        if entry is None or entry[0] != _cache_generation:
+            entry = cls._cache["type_hash"] = (_cache_generation, keccak(cls.encode_type().encode("utf-8")))
+        return entry[1]
 
     def hash_struct(self) -> bytes:
         """Return the hash of the struct.
 
         hash_struct => keccak(type_hash || encode_data)
         """
-        return keccak(b"".join([self.type_hash(), self.encode_value()]))
+        return keccak(self.type_hash() + self._encode_value())
+
+    def _cached_hash_struct(self) -> bytes:
+        """Return the hash of the struct, reusing the previous result if the struct hasn't changed since.
+
+        Used for domains, which are hashed for every signature but rarely change. Only structs whose values are all
+        immutable are cached, since a value that was modified in place can't be detected.
+        """
+        values = tuple(self.values.items())
+        if not all(type(v) in _IMMUTABLE_VALUE_TYPES for _, v in values):
+            return self.hash_struct()
+        # Value types are part of the key since e.g. True == 1, but they may not encode the same
+        key = (self.type_hash(), values, tuple(type(v) for _, v in values))
+        if self._hash_cache is None or self._hash_cache[0] != key:
+            self._hash_cache = (key, self.hash_struct())
+        return self._hash_cache[1]
 
     @classmethod
-    def get_members(cls) -> List[Tuple[str, EIP712Type | type[EIP712Type]]]:
-        """Return a list of tuples of supported parameters.
+    def get_members(cls) -> Tuple[Tuple[str, EIP712Type | type[EIP712Type]], ...]:
+        """Return a tuple of tuples of supported parameters.
 
         Each tuple is (<parameter_name>, <parameter_type>).
         """
-        return [
-            (name, attr)
-            for name, attr in cls.__dict__.items()
-            if isinstance(attr, EIP712Type) or isinstance(attr, type) and issubclass(attr, EIP712Type)
-        ]
+        members = cls._cache.get("members")
+        if members is None:
+            members = cls._cache["members"] = tuple(
+                (name, attr)
+                for name, attr in cls.__dict__.items()
+                if isinstance(attr, EIP712Type) or isinstance(attr, type) and issubclass(attr, EIP712Type)
+            )
+        return members
+
+    @classmethod
+    def _get_member_types(cls) -> dict:
+        """Return a dict mapping each member name to its type."""
+        member_types = cls._cache.get("member_types")
+        if member_types is None:
+            member_types = cls._cache["member_types"] = dict(cls.get_members())
+        return member_types
 
     @staticmethod
     def _assert_domain(domain: "EIP712Struct | None") -> "EIP712Struct":
@@ -163,12 +298,11 @@ class EIP712Struct(EIP712Type):
             dict: This struct + the domain in dict form, structured as specified for EIP712 messages.
         """
         domain = self._assert_domain(domain)
-        structs = {domain, self}
-        self._gather_reference_structs(structs)
 
-        # Build type dictionary
+        # Build type dictionary. Reference structs are sorted by name, so the message always comes out the same.
+        reference_structs = sorted(self._get_reference_structs(), key=lambda s: s.type_name)
         types = {}
-        for struct in structs:
+        for struct in (domain, self, *reference_structs):
             members_json = [
                 {
                     "name": m[0],
@@ -208,7 +342,26 @@ class EIP712Struct(EIP712Type):
             bytes: A 32-byte object containing the encoded data suitable for signing.
         """
         domain = self._assert_domain(domain)
-        return b"\x19\x01" + domain.hash_struct() + self.hash_struct()
+        return b"\x19\x01" + domain._cached_hash_struct() + self.hash_struct()  # pylint: disable=protected-access
+
+    @classmethod
+    def signable_bytes_batch(
+        cls, structs: Iterable["EIP712Struct"], domain: "EIP712Struct | None" = None
+    ) -> List[bytes]:
+        """Construct signable bytes for many structs which share the same domain.
+
+        Equivalent to calling `signable_bytes` on each struct, but the domain is only hashed once.
+
+        Args:
+            structs (Iterable[EIP712Struct]): The structs to construct signable bytes for.
+            domain (EIP712Struct | None, optional): The domain to include in the hash bytes.
+                Use `eip712_structs.default_domain` if None.
+
+        Returns:
+            List[bytes]: The signable bytes of each struct, in the same order as given.
+        """
+        prefix = b"\x19\x01" + cls._assert_domain(domain)._cached_hash_struct()  # pylint: disable=protected-access
+        return [prefix + struct.hash_struct() for struct in structs]
 
     @classmethod
     def from_message(cls, message_dict: dict) -> "StructTuple":
@@ -229,33 +382,39 @@ class EIP712Struct(EIP712Type):
             StructTuple: A StructTuple object, containing the message and domain structs.
         """
         structs = {}
-        unfulfilled_struct_params = defaultdict(list)
-
-        for type_name in message_dict["types"]:
-            # Dynamically construct struct class from dict representation
-            struct_from_json = type(type_name, (EIP712Struct,), {})
-            for member in message_dict["types"][type_name]:
-                # Either a basic solidity type is set, or None if referring to a reference struct (we'll fill it later)
-                setattr(struct_from_json, member["name"], from_solidity_type(member["type"]))
-                if getattr(struct_from_json, member["name"]) is None:
-                    # Track the refs we'll need to set later.
-                    unfulfilled_struct_params[type_name].append((member["name"], member["type"]))
-            structs[type_name] = struct_from_json
+        struct_members = {}
+        unfulfilled_struct_params = []
 
-        regex_pattern = r"([a-zA-Z0-9_]+)(\[(\d+)?\])?"
+        for type_name, members in message_dict["types"].items():
+            # Either a basic solidity type is set, or None if referring to a reference struct (we'll fill it later)
+            member_types = struct_members[type_name] = {
+                member["name"]: from_solidity_type(member["type"]) for member in members
+            }
+            # Track the refs we'll need to set later.
+            unfulfilled_struct_params.extend(
+                (type_name, member["name"], member["type"])
+                for member in members
+                if member_types[member["name"]] is None
+            )
+            # Dynamically construct struct class from dict representation. The module is set explicitly, since
+            # ABCMeta would otherwise report its own.
+            structs[type_name] = type(type_name, (EIP712Struct,), {"__module__": __name__, **member_types})
 
         # Now that custom structs have been parsed, pass through again to set the references
-        for struct_name, unfulfilled_member_names in unfulfilled_struct_params.items():
-            for name, type_name in unfulfilled_member_names:
-                match = re.match(regex_pattern, type_name)
-                assert match is not None, f'"{type_name}" is not a valid type name.'
-                ref_struct = structs[match[1]]
-                if match[2]:
-                    # The type is an array of the struct
-                    arr_len = match[3] or 0
-                    setattr(structs[struct_name], name, Array(ref_struct, int(arr_len)))
-                else:
-                    setattr(structs[struct_name], name, ref_struct)
+        for struct_name, name, type_name in unfulfilled_struct_params:
+            match = struct_type_pattern.match(type_name)
+            assert match is not None, f'"{type_name}" is not a valid type name.'
+            ref_struct = structs[match[1]]
+            if match[2]:
+                # The type is an array of the struct
+                arr_len = match[3] or 0
+                ref_struct = Array(ref_struct, int(arr_len))
+            setattr(structs[struct_name], name, ref_struct)
+            struct_members[struct_name][name] = ref_struct
+
+        # The members are known in declaration order already, so seed them rather than scanning each new class
+        for type_name, member_types in struct_members.items():
+            structs[type_name]._cache["members"] = tuple(member_types.items())
 
         return StructTuple(
             message=structs[message_dict["primaryType"]](**message_dict["message"]),
@@ -264,19 +423,18 @@ class EIP712Struct(EIP712Type):
 
     @classmethod
     def _assert_key_is_member(cls, key):
-        member_names = {tup[0] for tup in cls.get_members()}
-        if key not in member_names:
+        if key not in cls._get_member_types():
             raise KeyError(f'"{key}" is not defined for this struct.')
 
     @classmethod
     def _assert_property_type(cls, key, value):
         """Eagerly check for a correct member type."""
-        members = dict(cls.get_members())
-        typ = members[key]
+        typ = cls._get_member_types()[key]
 
         if isinstance(typ, type) and issubclass(typ, EIP712Struct):
-            # We expect an EIP712Struct instance. Assert that's true, and check the struct signature too.
-            if not isinstance(value, EIP712Struct) or value._encode_type(False) != typ._encode_type(False):  # pylint: disable=protected-access
+            # We expect an instance of that struct. Otherwise, accept any EIP712Struct with the same type hash.
+            # Subclasses are not trusted by isinstance, since they may define different members.
+            if type(value) is not typ and (not isinstance(value, EIP712Struct) or value.type_hash() != typ.type_hash()):
                 raise ValueError(f"Given value is of type {type(value)}, but we expected {typ}")
         else:
             # Since it isn't a nested struct, its an EIP712Type
@@ -320,8 +478,10 @@ class EIP712Struct(EIP712Type):
 
     def __hash__(self):
         """Hash is determined by the type name and value hash."""
-        value_hashes = [hash(k) ^ hash(v) for k, v in self.values.items()]
-        return functools.reduce(operator.xor, value_hashes, hash(self.type_name))
+        struct_hash = hash(self.type_name)
+        for k, v in self.values.items():
+            struct_hash ^= hash(k) ^ hash(v)
+        return struct_hash
 
 
 class StructTuple(NamedTuple):
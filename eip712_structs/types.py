@@ -1,15 +1,20 @@
 """EIP-712 Types."""
 
+import functools
 import re
 from json import JSONEncoder
 from typing import Any, Type, Union
 
+from eth_hash.auto import keccak
 from eth_utils.conversions import to_bytes, to_hex, to_int
-from eth_utils.crypto import keccak
 
 # allow magic value comparison
 # ruff: noqa: PLR2004
 
+# Encodings of 0 and 1 are very common (e.g. booleans and unset ints). Bytes are immutable, so share them.
+_ZERO32 = bytes(32)
+_ONE32 = bytes(31) + b"\x01"
+
 
 class EIP712Type:
     """The base type for members of a struct.
@@ -84,9 +89,11 @@ class Array(EIP712Type):
 
     def _encode_value(self, value):
         """Encode an array by concatenating its encoded contents, and taking the keccak256 hash."""
-        encoder = self.member_type
-        encoded_values = [encoder.encode_value(v) for v in value]
-        return keccak(b"".join(encoded_values))
+        encode_value = self.member_type.encode_value
+        encoded_values = bytearray()
+        for v in value:
+            encoded_values += encode_value(v)
+        return keccak(encoded_values)
 
 
 class Address(EIP712Type):
@@ -99,13 +106,13 @@ class Address(EIP712Type):
     def _encode_value(self, value):
         """Encode addresses like Uint160 numbers."""
         # Some smart conversions - need to get the address to a numeric before we encode it
+        if isinstance(value, str):
+            return _encode_hex_address(value)
         if isinstance(value, bytes):
             v = to_int(value)
-        elif isinstance(value, str):
-            v = to_int(hexstr=value)
         else:
             v = value  # Fallback, just use it as-is.
-        return Uint(160).encode_value(v)
+        return _UINT160.encode_value(v)
 
 
 class Boolean(EIP712Type):
@@ -118,9 +125,9 @@ class Boolean(EIP712Type):
     def _encode_value(self, value):
         """Booleans are encoded like the uint256 values of 0 and 1."""
         if value is False:
-            return Uint(256).encode_value(0)
+            return _ZERO32
         if value is True:
-            return Uint(256).encode_value(1)
+            return _ONE32
         raise ValueError(f"Must be True or False. Got: {value}")
 
 
@@ -155,10 +162,11 @@ class Bytes(EIP712Type):
             value = to_bytes(hexstr=value)
 
         if self.length == 0:
-            return keccak(value)
+            # The keccak backend only accepts bytes, so convert anything else (e.g. ints) first
+            return keccak(value if isinstance(value, (bytes, bytearray)) else to_bytes(value))
         if len(value) > self.length:
             raise ValueError(f"{self.type_name} was given bytes with length {len(value)}")
-        return value + bytes(32 - len(value))
+        return value.ljust(32, b"\x00")
 
 
 class Int(EIP712Type):
@@ -178,11 +186,15 @@ class Int(EIP712Type):
         if length < 8 or length > 256 or length % 8 != 0:
             raise ValueError(f"Int length must be a multiple of 8, between 8 and 256. Got: {length}")
         self.length = length
+        self._int_lim = 1 << (length - 1)
         super().__init__(f"int{length}", 0)
 
     def _encode_value(self, value: int):
         """Ints are encoded by padding them to 256-bit representations."""
-        value.to_bytes(self.length // 8, byteorder="big", signed=True)  # For validation
+        if not -self._int_lim <= value < self._int_lim:
+            raise OverflowError(f"int too big to convert to {self.type_name}: {value}")
+        if value == 0 and isinstance(value, int):
+            return _ZERO32
         return value.to_bytes(32, byteorder="big", signed=True)
 
 
@@ -195,7 +207,7 @@ class String(EIP712Type):
 
     def _encode_value(self, value):
         """Strings are encoded by taking the keccak256 hash of their contents."""
-        return keccak(text=value)
+        return keccak(value.encode("utf-8"))
 
 
 class Uint(EIP712Type):
@@ -215,11 +227,17 @@ class Uint(EIP712Type):
         if length < 8 or length > 256 or length % 8 != 0:
             raise ValueError(f"Uint length must be a multiple of 8, between 8 and 256. Got: {length}")
         self.length = length
+        self._uint_mask = (1 << length) - 1
         super().__init__(f"uint{length}", 0)
 
     def _encode_value(self, value: int):
         """Uints are encoded by padding them to 256-bit representations."""
-        value.to_bytes(self.length // 8, byteorder="big", signed=False)  # For validation
+        if value < 0:
+            raise OverflowError(f"can't convert negative int to unsigned {self.type_name}: {value}")
+        if value > self._uint_mask:
+            raise OverflowError(f"int too big to convert to {self.type_name}: {value}")
+        if value == 0 and isinstance(value, int):
+            return _ZERO32
         return value.to_bytes(32, byteorder="big", signed=False)
 
 
@@ -231,6 +249,18 @@ def assert_int(value) -> int:
         raise ValueError(f"Expected an int, got {value}") from exc
 
 
+_UINT160 = Uint(160)
+
+
+@functools.lru_cache(maxsize=4096)
+def _encode_hex_address(value: str) -> bytes:
+    """Encode an address given as a hex string.
+
+    Parsing hex is relatively slow, and the same addresses tend to be encoded over and over, so results are cached.
+    """
+    return _UINT160.encode_value(to_int(hexstr=value))
+
+
 # This helper dict maps solidity's type names to our EIP712Type classes
 solidity_type_map = {
     "address": Address,
@@ -242,10 +272,26 @@ solidity_type_map = {
 }
 
 
+# Shared instances of the most common types, so they don't need to be parsed. Types hold no per-value state.
+common_solidity_types = {
+    "address": Address(),
+    "bool": Boolean(),
+    "bytes": Bytes(),
+    "bytes32": Bytes(32),
+    "int256": Int(256),
+    "string": String(),
+    "uint256": Uint(256),
+}
+
+solidity_type_pattern = re.compile(r"([a-z]+)(\d+)?(\[(\d+)?\])?")
+
+
 def from_solidity_type(solidity_type: str) -> EIP712Type | None:
     """Convert a string into the EIP712Type implementation. Basic types only."""
-    pattern = r"([a-z]+)(\d+)?(\[(\d+)?\])?"
-    match = re.match(pattern, solidity_type)
+    if (common_type := common_solidity_types.get(solidity_type)) is not None:
+        return common_type
+
+    match = solidity_type_pattern.match(solidity_type)
 
     if match is None:
         return None
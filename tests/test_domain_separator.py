@@ -103,3 +103,19 @@ def test_default_domain(default_domain_manager):
     # Using a different domain should not use any current default domain
     assert implicit_msg != foo.to_message(other_domain)
     assert implicit_bytes != foo.signable_bytes(other_domain)
+
+
+def test_repeated_domains_keep_struct_caches():
+    class Foo(EIP712Struct):
+        s = String()
+
+    Foo.type_hash()
+    type_hash_entry = Foo._cache["type_hash"]  # pylint: disable=protected-access
+    cache_generation = eip712_structs.struct._cache_generation  # pylint: disable=protected-access
+
+    # Building domains must not drop the cached data of any struct class
+    for _ in range(10):
+        make_domain(name="hello", chainId=1)
+    assert Foo._cache["type_hash"] is type_hash_entry  # pylint: disable=protected-access
+    assert eip712_structs.struct._cache_generation == cache_generation  # pylint: disable=protected-access
+
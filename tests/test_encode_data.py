@@ -147,6 +147,9 @@ def test_data_dicts():
     }
     assert bar.data_dict() == expected_result
 
+    # Unset nested structs are left as None
+    assert Bar(b=b"\xff").data_dict() == {"foo": None, "b": b"\xff"}
+
 
 def test_signable_bytes():
     class Foo(EIP712Struct):
@@ -166,6 +169,37 @@ def test_signable_bytes():
     assert sign_bytes[34:] == exp_struct_bytes
 
 
+def test_signable_bytes_batch():
+    class Foo(EIP712Struct):
+        s = String()
+        i = Int(256)
+
+    domain = make_domain(name="hello")
+    foos = [Foo(s="hello", i=i) for i in range(3)]
+
+    assert EIP712Struct.signable_bytes_batch(foos, domain) == [foo.signable_bytes(domain) for foo in foos]
+    assert not EIP712Struct.signable_bytes_batch([], domain)
+
+
+def test_signable_bytes_domain_changes():
+    class Foo(EIP712Struct):
+        s = String()
+
+    domain = make_domain(name="hello", salt=bytearray(32))
+    foo = Foo(s="hello")
+
+    # Changes to the domain must be picked up, regardless of how they are made
+    for change in [
+        lambda: domain.__setitem__("name", "world"),
+        lambda: domain.set_data_value("name", "again"),
+        lambda: domain.values["salt"].__setitem__(0, 1),
+    ]:
+        sign_bytes = foo.signable_bytes(domain)
+        change()
+        assert foo.signable_bytes(domain) != sign_bytes
+        assert foo.signable_bytes(domain)[2:34] == keccak(domain.type_hash() + domain.encode_value())
+
+
 def test_none_replacement():
     class Foo(EIP712Struct):
         s = String()
@@ -189,6 +223,8 @@ def test_validation_errors():
     with pytest.raises(ValueError, match="bytes10 was given bytes with length 11"):
         bytes_type.encode_value(os.urandom(11))
 
+    assert int_type.encode_value(127) == bytes(31) + b"\x7f"
+    assert int_type.encode_value(-128) == b"\xff" * 31 + b"\x80"
     with pytest.raises(OverflowError, match="too big"):
         int_type.encode_value(128)
     with pytest.raises(OverflowError, match="too big"):
@@ -197,6 +233,7 @@ def test_validation_errors():
     with pytest.raises(OverflowError, match="too big"):
         uint_type.encode_value(256)
     assert uint_type.encode_value(0) == bytes(32)
+    assert uint_type.encode_value(255) == bytes(31) + b"\xff"
     with pytest.raises(OverflowError, match="negative int to unsigned"):
         uint_type.encode_value(-1)
 
@@ -208,6 +245,21 @@ def test_validation_errors():
         bool_type.encode_value(1)
 
 
+def test_address_encoding():
+    address_type = Address()
+    address_bytes = os.urandom(20)
+    expected = bytes(12) + address_bytes
+
+    assert address_type.encode_value(address_bytes) == expected
+    assert address_type.encode_value(int.from_bytes(address_bytes, "big")) == expected
+    # Hex strings are cached, so check repeated calls too
+    for _ in range(2):
+        assert address_type.encode_value("0x" + address_bytes.hex()) == expected
+
+    with pytest.raises(OverflowError, match="too big"):
+        address_type.encode_value("0x" + "ff" * 21)
+
+
 def test_struct_eq():
     class Foo(EIP712Struct):
         s = String()
@@ -307,5 +359,16 @@ def test_value_access():
         # Expects a Foo type, so should throw an error
         bar["f"] = baz
 
+    # A different class with the same definition is still accepted, but a subclass with other members isn't
+    same_foo_class = type("Foo", (EIP712Struct,), {"s": String(), "b": Bytes(32)})
+    bar["f"] = same_foo_class(s=test_str, b=test_bytes)
+    assert bar["f"] == Foo(s=test_str, b=test_bytes)
+
+    class SubFoo(Foo):
+        s = String()
+
+    with pytest.raises(ValueError):
+        bar["f"] = SubFoo(s=test_str)
+
     with pytest.raises(TypeError):
         del foo["s"]
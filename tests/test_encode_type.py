@@ -1,5 +1,7 @@
 """Test encoding types."""
 
+import abc
+
 from eip712_structs import Address, Array, EIP712Struct, Int, String, Uint
 
 # allow lots of function arguments
@@ -124,3 +126,52 @@ def test_circular_reference():
     assert A.encode_type() == expected_result_a
     assert B.encode_type() == expected_result_b
     assert C.encode_type() == expected_result_c
+
+
+def test_members_added_after_use():
+    class Person(EIP712Struct):
+        name = String()
+
+    assert Person.encode_type() == "Person(string name)"
+    assert Person.get_members() == (("name", String()),)
+
+    # Adding or removing members after the struct type has been used must be reflected
+    Person.addr = Address()
+    assert Person.encode_type() == "Person(string name,address addr)"
+    assert [name for name, _ in Person.get_members()] == ["name", "addr"]
+
+    del Person.addr
+    assert Person.encode_type() == "Person(string name)"
+
+
+def test_reference_modified_after_use():
+    class B(EIP712Struct):
+        s = String()
+
+    class A(EIP712Struct):
+        b = B
+
+    assert A.encode_type() == "A(B b)B(string s)"
+    type_hash = A.type_hash()
+
+    # A's encoded type includes B, so modifying B must also be reflected in A
+    B.i = Int(256)
+    assert A.encode_type() == "A(B b)B(string s,int256 i)"
+    assert A.type_hash() != type_hash
+
+
+def test_abstract_struct():
+    class Base(EIP712Struct, abc.ABC):
+        s = String()
+
+        @abc.abstractmethod
+        def describe(self): ...
+
+    class Concrete(Base):
+        s = String()
+
+        def describe(self):
+            return self["s"]
+
+    assert Concrete.encode_type() == "Concrete(string s)"
+    assert Concrete(s="hi").describe() == "hi"
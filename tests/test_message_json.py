@@ -5,7 +5,7 @@ import os
 
 import pytest
 
-from eip712_structs import Bytes, EIP712Struct, String, make_domain
+from eip712_structs import Array, Bytes, EIP712Struct, String, Uint, make_domain
 
 # allow magic value comparison
 # ruff: noqa: PLR2004
@@ -120,10 +120,13 @@ def test_nested_struct_to_message():
 
     message = foo.to_message(domain)
     assert message == expected_result
+    assert list(message["types"]) == ["EIP712Domain", "Foo", "Bar"]
 
     # And test in reverse...
     new_struct, new_domain = EIP712Struct.from_message(expected_result)
     assert new_struct.type_name == "Foo"
+    assert type(new_struct).__module__ == "eip712_structs.struct"
+    assert type(new_domain).__module__ == "eip712_structs.struct"
 
     members = new_struct.get_members()
     assert len(members) == 2
@@ -137,6 +140,43 @@ def test_nested_struct_to_message():
     assert foo.hash_struct() == new_struct.hash_struct()
 
 
+def test_array_struct_to_message():
+    class Foo(EIP712Struct):
+        nums = Array(Uint(256))
+
+    domain = make_domain(name="domain")
+    foo = Foo(nums=[1, 2, 3])
+
+    message = foo.to_message(domain)
+    assert message["types"]["Foo"] == [{"name": "nums", "type": "uint256[]"}]
+    assert message["message"] == {"nums": [1, 2, 3]}
+
+    new_struct, _ = EIP712Struct.from_message(message)
+    assert new_struct.hash_struct() == foo.hash_struct()
+
+
+def test_repeated_from_message():
+    class Bar(EIP712Struct):
+        s = String()
+
+    class Foo(EIP712Struct):
+        s = String()
+        bar = Bar
+
+    domain = make_domain(name="domain")
+    foo = Foo(s="foo", bar=Bar(s="bar"))
+    message = foo.to_message(domain)
+    foo.hash_struct()
+    type_hash_entry = Foo._cache["type_hash"]  # pylint: disable=protected-access
+
+    for _ in range(10):
+        result = EIP712Struct.from_message(message)
+        assert result.message.hash_struct() == foo.hash_struct()
+
+    # Deserializing may not drop the cached data of the struct classes it doesn't create
+    assert Foo._cache["type_hash"] is type_hash_entry  # pylint: disable=protected-access
+
+
 def test_bytes_json_encoder():
     class Foo(EIP712Struct):
         b = Bytes(32)
@@ -163,3 +203,17 @@ def test_bytes_json_encoder():
     foo.values["b"] = obj
     with pytest.raises(TypeError, match="not JSON serializable"):
         foo.to_message_json(domain)
+
+
+def test_large_int_json():
+    class Foo(EIP712Struct):
+        s = String()
+        large = Uint(256)
+
+    domain = make_domain(name="domain", chainId=1)
+    # Ints wider than 64 bits, like most uint256 amounts, must serialize exactly
+    foo = Foo(s="café", large=2**255)
+
+    result = foo.to_message_json(domain)
+    assert f'"message": {{"s": "caf\\u00e9", "large": {2**255}}}' in result
+    assert json.loads(result)["message"] == {"s": "café", "large": 2**255}